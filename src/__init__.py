@@ -7,6 +7,7 @@ from .ascii_converter import (
     ASCIIArt,
     ConversionSettings,
     convert_image,
+    convert_images,
     convert_to_emoji,
     image_to_ascii,
     image_to_emoji,
@@ -25,6 +26,8 @@ from .color_handler import (
     ColorMode,
     ColorHandler,
     quantize_color,
+    quantize_array,
+    brightness_array,
 )
 from .image_processor import ImageProcessor
 from .gui import ASCIIArtGUI
@@ -38,6 +41,7 @@ __all__ = [
     "ASCIIArt",
     "ConversionSettings",
     "convert_image",
+    "convert_images",
     "convert_to_emoji",
     "image_to_ascii",
     "image_to_emoji",
@@ -56,6 +60,8 @@ __all__ = [
     "ColorMode",
     "ColorHandler",
     "quantize_color",
+    "quantize_array",
+    "brightness_array",
     
     # Image processing
     "ImageProcessor",
@@ -2,17 +2,20 @@
 Core ASCII art conversion engine with emoji support.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Union, List
 from dataclasses import dataclass, field
 import numpy as np
+from PIL import Image
 
 from .image_processor import ImageProcessor
 from .character_sets import (
     CharacterMapper, CharacterSet, EmojiSet,
     get_charset_by_name, get_emoji_set_by_name
 )
-from .color_handler import ColorHandler, ColorMode, RGB
+from .color_handler import ColorHandler, ColorMode, quantize_array
 
 
 @dataclass
@@ -37,6 +40,9 @@ class ConversionSettings:
     dithering: bool = False
     sharpen: float = 1.0
     auto_enhance: bool = False
+    color_levels: Optional[int] = 8  # Levels per channel for colored output (None = full color)
+    pre_resize_factor: Optional[int] = 2  # Downscale to this multiple of width before filtering (None = off)
+    use_cv2_fastpath: bool = False  # Run the filters below in one OpenCV pass
 
 
 @dataclass
@@ -139,12 +145,12 @@ class ASCIIConverter:
         self._apply_preprocessing()
         
         # Generate ASCII
-        ascii_lines = self._generate_ascii()
+        ascii_text = self._generate_ascii()
         
         # Apply color formatting
         color_handler = ColorHandler(settings.color_mode)
         formatted_art = color_handler.wrap_output(
-            '\n'.join(ascii_lines),
+            ascii_text,
             is_emoji=settings.use_emoji
         )
         
@@ -161,24 +167,40 @@ class ASCIIConverter:
         """Apply image preprocessing based on settings."""
         settings = self.settings
         
-        # Apply denoising early (on full resolution image)
-        if settings.denoise:
-            self.processor.denoise()
+        # Coarse downscale first so the filters below only touch a few
+        # times more pixels than the final ASCII grid
+        if settings.pre_resize_factor:
+            coarse_width = settings.width * settings.pre_resize_factor
+            if self.processor.size[0] > coarse_width:
+                self.processor.resize(width=coarse_width, char_aspect_ratio=1.0)
         
-        # Adjust contrast and brightness before resize for better quality
-        if settings.contrast != 1.0:
-            self.processor.adjust_contrast(settings.contrast)
-        
-        if settings.brightness != 1.0:
-            self.processor.adjust_brightness(settings.brightness)
-        
-        # Auto enhance
-        if settings.auto_enhance:
-            self.processor.auto_enhance()
-        
-        # Sharpen before resize
-        if settings.sharpen != 1.0:
-            self.processor.sharpen(settings.sharpen)
+        if settings.use_cv2_fastpath:
+            self.processor.apply_filters_cv2(
+                denoise=settings.denoise,
+                contrast=settings.contrast,
+                brightness=settings.brightness,
+                auto_enhance=settings.auto_enhance,
+                sharpen=settings.sharpen
+            )
+        else:
+            # Apply denoising early (before the final resize)
+            if settings.denoise:
+                self.processor.denoise()
+            
+            # Adjust contrast and brightness before resize for better quality
+            if settings.contrast != 1.0:
+                self.processor.adjust_contrast(settings.contrast)
+            
+            if settings.brightness != 1.0:
+                self.processor.adjust_brightness(settings.brightness)
+            
+            # Auto enhance
+            if settings.auto_enhance:
+                self.processor.auto_enhance()
+            
+            # Sharpen before resize
+            if settings.sharpen != 1.0:
+                self.processor.sharpen(settings.sharpen)
         
         # Resize with proper aspect ratio for ASCII vs emoji
         # Emoji characters are roughly square, ASCII chars are taller than wide
@@ -196,16 +218,16 @@ class ASCIIConverter:
         elif not settings.use_emoji:
             self.processor.to_grayscale()
     
-    def _generate_ascii(self) -> List[str]:
-        """Generate ASCII art lines from processed image."""
+    def _generate_ascii(self) -> str:
+        """Generate ASCII art text from processed image."""
         settings = self.settings
         
-        # Get pixel data
-        grayscale_matrix = self.processor.get_pixel_matrix()
+        # Color-based emoji mapping reads colors instead of brightness
+        color_emoji = settings.use_emoji and settings.color_emoji
         
         # Get color data if needed
         color_matrix = None
-        if settings.color_mode != ColorMode.NONE or settings.color_emoji:
+        if settings.color_mode != ColorMode.NONE or color_emoji:
             color_matrix = self.processor.get_color_matrix()
         
         # Setup character mapper
@@ -218,43 +240,25 @@ class ASCIIConverter:
         # Setup color handler
         color_handler = ColorHandler(settings.color_mode)
         
-        # Generate ASCII
-        lines = []
-        height, width = grayscale_matrix.shape[:2]
+        # Map all pixels to characters in one vectorized pass
+        if color_emoji:
+            chars = mapper.map_colored_emoji_array(color_matrix)
+        else:
+            # Only extract grayscale when brightness drives the mapping
+            grayscale_matrix = self.processor.get_pixel_matrix()
+            if settings.invert:
+                grayscale_matrix = 255 - grayscale_matrix
+            chars = mapper.map_array(grayscale_matrix)
         
-        for y in range(height):
-            line_chars = []
-            for x in range(width):
-                # Get brightness
-                brightness = float(grayscale_matrix[y, x])
-                
-                # Get character or emoji
-                if settings.use_emoji and settings.color_emoji and color_matrix is not None:
-                    # Color-based emoji mapping
-                    r, g, b = color_matrix[y, x]
-                    char = mapper.get_colored_emoji(int(r), int(g), int(b))
-                elif settings.invert:
-                    char = mapper.get_inverted_character(brightness)
-                else:
-                    char = mapper.get_character(brightness)
-                
-                # Apply color if enabled (for non-emoji)
-                if color_matrix is not None and settings.color_mode != ColorMode.NONE:
-                    r, g, b = color_matrix[y, x]
-                    color = RGB(int(r), int(g), int(b))
-                    
-                    if settings.use_emoji:
-                        char = color_handler.format_emoji(char, color)
-                    else:
-                        char = color_handler.format_character(char, color)
-                
-                line_chars.append(char)
-            
-            line = ''.join(line_chars)
-            line = color_handler.format_line(line) if settings.color_mode in (ColorMode.HTML, ColorMode.HTML_BG) else line
-            lines.append(line)
+        if settings.color_mode == ColorMode.NONE:
+            return '\n'.join(''.join(row) for row in chars.tolist())
         
-        return lines
+        # Quantize colors so formatting only sees a small set of distinct colors
+        if settings.color_levels:
+            color_matrix = quantize_array(color_matrix, settings.color_levels)
+        
+        # Apply color to the whole character matrix
+        return color_handler.format_array(chars, color_matrix, is_emoji=settings.use_emoji)
     
     def preview(self, width: int = 60) -> str:
         """Generate a quick preview with default settings."""
@@ -296,6 +300,66 @@ def convert_image(
     return art
 
 
+# Below this average size per image, process start-up and result pickling
+# cost more than the conversion itself, so batches stay serial.
+PARALLEL_MIN_PIXELS = 1_000_000
+
+
+def _average_pixels(paths: List[Path]) -> float:
+    """Average pixel count of the images, read from headers only."""
+    total = 0
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                total += img.width * img.height
+        except (OSError, ValueError):
+            pass
+    return total / len(paths)
+
+
+def convert_images(
+    paths: List[Union[str, Path]],
+    output_dir: Optional[Union[str, Path]] = None,
+    workers: Optional[int] = None,
+    **settings
+) -> List[ASCIIArt]:
+    """
+    Convert several images, using a process pool when it pays off.
+    
+    Conversion is CPU-bound and PIL plus the Python glue hold the GIL, so
+    processes are used rather than threads. Small batches or small images
+    are converted serially, since worker start-up would dominate.
+    
+    Args:
+        paths: Paths to input images
+        output_dir: Optional directory to save one output file per image
+        workers: Number of worker processes (default: CPU count)
+        **settings: Conversion settings applied to every image
+        
+    Returns:
+        Generated ASCII art, in the same order as paths
+    """
+    paths = [Path(p) for p in paths]
+    if not paths:
+        return []
+    
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if output_dir is not None:
+        outputs = [Path(output_dir) / p.with_suffix('.txt').name for p in paths]
+    else:
+        outputs = [None] * len(paths)
+    
+    if workers <= 1 or _average_pixels(paths) < PARALLEL_MIN_PIXELS:
+        return [convert_image(p, out, **settings) for p, out in zip(paths, outputs)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(convert_image, p, out, **settings)
+            for p, out in zip(paths, outputs)
+        ]
+        return [future.result() for future in futures]
+
+
 def convert_to_emoji(
     image_path: Union[str, Path],
     output_path: Optional[Union[str, Path]] = None,
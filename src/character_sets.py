@@ -4,7 +4,15 @@ Includes traditional ASCII, block characters, and emoji sets.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Dict, Optional
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 class CharacterSet(Enum):
@@ -30,43 +38,100 @@ class CharacterSet(Enum):
 
 
 class EmojiSet(Enum):
-    """Emoji character sets for creative ASCII art."""
+    """Emoji character sets for creative ASCII art (tuples, dark to light)."""
     
     # Brightness-based emoji (dark to light)
-    BRIGHTNESS = ["⬛", "🟫", "🟥", "🟧", "🟨", "🟩", "🟦", "🟪", "⬜"]
+    BRIGHTNESS = ("⬛", "🟫", "🟥", "🟧", "🟨", "🟩", "🟦", "🟪", "⬜")
     
     # Grayscale circles
-    GRAYSCALE = ["⚫", "🔴", "🟤", "🟠", "🟡", "🟢", "🔵", "🟣", "⚪"]
+    GRAYSCALE = ("⚫", "🔴", "🟤", "🟠", "🟡", "🟢", "🔵", "🟣", "⚪")
     
     # Hearts (dark to light feeling)
-    HEARTS = ["🖤", "❤️", "🧡", "💛", "💚", "💙", "💜", "🤍", "💗"]
+    HEARTS = ("🖤", "❤️", "🧡", "💛", "💚", "💙", "💜", "🤍", "💗")
     
     # Squares only
-    SQUARES = ["⬛", "🟫", "🟥", "🟧", "🟨", "🟩", "🟦", "🟪", "⬜"]
+    SQUARES = ("⬛", "🟫", "🟥", "🟧", "🟨", "🟩", "🟦", "🟪", "⬜")
     
     # Nature theme
-    NATURE = ["🌑", "🌲", "🌳", "🌴", "🌿", "🍀", "🌸", "🌼", "☀️"]
+    NATURE = ("🌑", "🌲", "🌳", "🌴", "🌿", "🍀", "🌸", "🌼", "☀️")
     
     # Space theme
-    SPACE = ["⬛", "🌑", "🌙", "⭐", "✨", "💫", "🌟", "⚡", "☀️"]
+    SPACE = ("⬛", "🌑", "🌙", "⭐", "✨", "💫", "🌟", "⚡", "☀️")
     
     # Ocean theme
-    OCEAN = ["🌊", "🐳", "🐬", "🐠", "🐟", "🦈", "🐙", "🦑", "💎"]
+    OCEAN = ("🌊", "🐳", "🐬", "🐠", "🐟", "🦈", "🐙", "🦑", "💎")
     
     # Food theme
-    FOOD = ["🍫", "🍩", "🍪", "🧁", "🍰", "🍨", "🍦", "🎂", "🍬"]
+    FOOD = ("🍫", "🍩", "🍪", "🧁", "🍰", "🍨", "🍦", "🎂", "🍬")
     
     # Faces
-    FACES = ["😈", "👿", "😠", "😐", "🙂", "😊", "😄", "😁", "🌟"]
+    FACES = ("😈", "👿", "😠", "😐", "🙂", "😊", "😄", "😁", "🌟")
     
     # Weather
-    WEATHER = ["🌑", "☁️", "🌧️", "⛈️", "🌤️", "⛅", "🌥️", "☀️", "✨"]
+    WEATHER = ("🌑", "☁️", "🌧️", "⛈️", "🌤️", "⛅", "🌥️", "☀️", "✨")
     
     # Fire theme
-    FIRE = ["⬛", "🟤", "🔴", "🟠", "🟡", "🔥", "💥", "⭐", "💫"]
+    FIRE = ("⬛", "🟤", "🔴", "🟠", "🟡", "🔥", "💥", "⭐", "💫")
     
     # Custom geometric
-    GEOMETRIC = ["◼️", "◾", "▪️", "◽", "◻️", "⬜", "🔲", "🔳", "💠"]
+    GEOMETRIC = ("◼️", "◾", "▪️", "◽", "◻️", "⬜", "🔲", "🔳", "💠")
+
+
+# Emojis used by color-based mapping, indexed by color code
+COLOR_EMOJI_BY_CODE = ('⬛', '⬜', '🟥', '🟧', '🟨', '🟩', '🟦', '🟪')
+_COLOR_EMOJI_ARRAY = np.array(COLOR_EMOJI_BY_CODE)
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _classify_colors(rgb, out):
+        """Write the color code of every pixel of rgb into out."""
+        height, width = out.shape
+        for y in prange(height):
+            for x in range(width):
+                r = int(rgb[y, x, 0])
+                g = int(rgb[y, x, 1])
+                b = int(rgb[y, x, 2])
+                total = r + g + b
+                
+                if total < 90:
+                    out[y, x] = 0
+                elif total > 675:
+                    out[y, x] = 1
+                elif r >= g and r >= b:
+                    if g > 150 and r > 200:
+                        out[y, x] = 4
+                    elif g > 100:
+                        out[y, x] = 3
+                    else:
+                        out[y, x] = 2
+                elif g >= b:
+                    out[y, x] = 5
+                elif r > 150:
+                    out[y, x] = 7
+                else:
+                    out[y, x] = 6
+else:
+    def _classify_colors(rgb, out):
+        """Write the color code of every pixel of rgb into out."""
+        rgb = rgb.astype(np.int32)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        total = r + g + b
+        max_channel = rgb.max(axis=-1)
+        
+        red_max = r == max_channel
+        green_max = ~red_max & (g == max_channel)
+        blue_max = ~red_max & ~green_max
+        
+        conditions = [
+            total < 90,                         # brightness < 30
+            total > 675,                        # brightness > 225
+            red_max & (g > 150) & (r > 200),
+            red_max & (g > 100),
+            red_max,
+            green_max,
+            blue_max & (r > 150),
+        ]
+        out[...] = np.select(conditions, [0, 1, 4, 3, 2, 5, 7], default=6)
 
 
 class CharacterMapper:
@@ -88,6 +153,11 @@ class CharacterMapper:
             self.is_emoji = False
         
         self.num_chars = len(self.characters)
+        
+        # Lookup table for vectorized mapping of whole pixel matrices
+        self._char_array = np.array(list(self.characters))
+        self._n = self.num_chars
+        self._scale = self.num_chars - 1
     
     def get_character(self, brightness: float) -> str:
         """
@@ -110,10 +180,52 @@ class CharacterMapper:
         index = max(0, min(index, self.num_chars - 1))
         return self.characters[index]
     
+    def get_character_u8(self, brightness: int) -> str:
+        """
+        Convert an integer brightness (0-255) to ASCII character or emoji.
+        
+        Integer-only version of get_character() for values already known
+        to be in range, such as elements of a uint8 pixel matrix.
+        """
+        return self.characters[(brightness * self._scale + 127) // 255]
+    
     def get_inverted_character(self, brightness: float) -> str:
         """Get character with inverted brightness mapping."""
         return self.get_character(255 - brightness)
     
+    def map_array(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Convert a matrix of brightness values (0-255) to characters.
+        
+        Vectorized equivalent of calling get_character() on every pixel.
+        
+        Args:
+            gray: 2D uint8 array of pixel brightness values
+            
+        Returns:
+            2D array of characters with the same shape as gray
+        """
+        # Integer form of int(brightness / 255 * (n - 1) + 0.5)
+        idx = (gray.astype(np.int32) * self._scale + 127) // 255
+        np.clip(idx, 0, self._scale, out=idx)
+        return self._char_array[idx]
+    
+    def map_colored_emoji_array(self, rgb: np.ndarray) -> np.ndarray:
+        """
+        Convert a matrix of RGB colors to color emojis.
+        
+        Vectorized equivalent of calling get_colored_emoji() on every pixel.
+        
+        Args:
+            rgb: (H, W, 3) uint8 array of RGB colors
+            
+        Returns:
+            2D array of emojis with shape (H, W)
+        """
+        codes = np.empty(rgb.shape[:2], dtype=np.int8)
+        _classify_colors(np.ascontiguousarray(rgb, dtype=np.uint8), codes)
+        return _COLOR_EMOJI_ARRAY[codes]
+    
     def get_colored_emoji(self, r: int, g: int, b: int) -> str:
         """
         Get emoji based on dominant color.
@@ -163,46 +275,48 @@ class CharacterMapper:
             return color_emojis['blue']
 
 
+_CHARSET_BY_NAME: Dict[str, CharacterSet] = {
+    "standard": CharacterSet.STANDARD,
+    "detailed": CharacterSet.DETAILED,
+    "simple": CharacterSet.SIMPLE,
+    "blocks": CharacterSet.BLOCKS,
+    "numbers": CharacterSet.NUMBERS,
+    "letters": CharacterSet.LETTERS,
+}
+
+_EMOJI_SET_BY_NAME: Dict[str, EmojiSet] = {
+    "brightness": EmojiSet.BRIGHTNESS,
+    "grayscale": EmojiSet.GRAYSCALE,
+    "hearts": EmojiSet.HEARTS,
+    "squares": EmojiSet.SQUARES,
+    "nature": EmojiSet.NATURE,
+    "space": EmojiSet.SPACE,
+    "ocean": EmojiSet.OCEAN,
+    "food": EmojiSet.FOOD,
+    "faces": EmojiSet.FACES,
+    "weather": EmojiSet.WEATHER,
+    "fire": EmojiSet.FIRE,
+    "geometric": EmojiSet.GEOMETRIC,
+}
+
+
+@lru_cache(maxsize=32)
 def get_charset_by_name(name: str) -> CharacterSet:
     """Get character set by name string."""
-    name_map = {
-        "standard": CharacterSet.STANDARD,
-        "detailed": CharacterSet.DETAILED,
-        "simple": CharacterSet.SIMPLE,
-        "blocks": CharacterSet.BLOCKS,
-        "numbers": CharacterSet.NUMBERS,
-        "letters": CharacterSet.LETTERS,
-    }
-    return name_map.get(name.lower(), CharacterSet.DETAILED)
+    return _CHARSET_BY_NAME.get(name.lower(), CharacterSet.DETAILED)
 
 
+@lru_cache(maxsize=32)
 def get_emoji_set_by_name(name: str) -> EmojiSet:
     """Get emoji set by name string."""
-    name_map = {
-        "brightness": EmojiSet.BRIGHTNESS,
-        "grayscale": EmojiSet.GRAYSCALE,
-        "hearts": EmojiSet.HEARTS,
-        "squares": EmojiSet.SQUARES,
-        "nature": EmojiSet.NATURE,
-        "space": EmojiSet.SPACE,
-        "ocean": EmojiSet.OCEAN,
-        "food": EmojiSet.FOOD,
-        "faces": EmojiSet.FACES,
-        "weather": EmojiSet.WEATHER,
-        "fire": EmojiSet.FIRE,
-        "geometric": EmojiSet.GEOMETRIC,
-    }
-    return name_map.get(name.lower(), EmojiSet.BRIGHTNESS)
+    return _EMOJI_SET_BY_NAME.get(name.lower(), EmojiSet.BRIGHTNESS)
 
 
 def list_available_charsets() -> List[str]:
     """List all available character set names."""
-    return ["standard", "detailed", "simple", "blocks", "numbers", "letters"]
+    return list(_CHARSET_BY_NAME)
 
 
 def list_available_emoji_sets() -> List[str]:
     """List all available emoji set names."""
-    return [
-        "brightness", "grayscale", "hearts", "squares", "nature",
-        "space", "ocean", "food", "faces", "weather", "fire", "geometric"
-    ]
+    return list(_EMOJI_SET_BY_NAME)
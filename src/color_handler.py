@@ -2,15 +2,19 @@
 Color handling for terminal and HTML ASCII art output.
 """
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List, Dict
 from enum import Enum
 from dataclasses import dataclass
 import colorsys
+import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True)
 class RGB:
     """RGB color representation."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("r", "g", "b")
+    
     r: int
     g: int
     b: int
@@ -84,6 +88,19 @@ class ColorMode(Enum):
     HTML_BG = "html_bg"     # HTML with background colors
 
 
+# Characters that must be escaped in HTML output, per color mode
+_ESCAPE_TABLES = {
+    ColorMode.HTML: str.maketrans({
+        '<': '&lt;',
+        '>': '&gt;',
+        '&': '&amp;',
+        '"': '&quot;',
+        ' ': '&nbsp;',
+    }),
+    ColorMode.HTML_BG: str.maketrans({' ': '&nbsp;'}),
+}
+
+
 class ColorHandler:
     """Handles color conversion and output formatting."""
     
@@ -91,6 +108,8 @@ class ColorHandler:
     
     def __init__(self, mode: ColorMode = ColorMode.NONE):
         self.mode = mode
+        # Escape prefixes keyed by packed 24-bit color (r << 16 | g << 8 | b)
+        self._prefix_cache: Dict[int, str] = {}
     
     def format_character(
         self, 
@@ -110,35 +129,129 @@ class ColorHandler:
         if color is None or self.mode == ColorMode.NONE:
             return char
         
-        if self.mode == ColorMode.ANSI:
-            return f"{color.to_ansi_fg()}{char}{self.RESET}"
+        key = (color.r << 16) | (color.g << 8) | color.b
+        return f"{self._color_prefix(key)}{self._escape(char)}{self._color_suffix()}"
+    
+    def _color_prefix(self, key: int) -> str:
+        """Get the opening color markup for a packed 24-bit color."""
+        prefix = self._prefix_cache.get(key)
+        if prefix is not None:
+            return prefix
         
+        r, g, b = key >> 16, (key >> 8) & 0xFF, key & 0xFF
+        dark = 0.299 * r + 0.587 * g + 0.114 * b < 128
+        
+        if self.mode == ColorMode.ANSI:
+            prefix = f"\033[38;2;{r};{g};{b}m"
         elif self.mode == ColorMode.ANSI_BG:
             # Use contrasting text color for readability
-            text_color = RGB(255, 255, 255) if color.brightness() < 128 else RGB(0, 0, 0)
-            return f"{color.to_ansi_bg()}{text_color.to_ansi_fg()}{char}{self.RESET}"
-        
+            text_color = "\033[38;2;255;255;255m" if dark else "\033[38;2;0;0;0m"
+            prefix = f"\033[48;2;{r};{g};{b}m{text_color}"
         elif self.mode == ColorMode.HTML:
-            # Escape HTML special characters
-            if char == '<':
-                char = '&lt;'
-            elif char == '>':
-                char = '&gt;'
-            elif char == '&':
-                char = '&amp;'
-            elif char == '"':
-                char = '&quot;'
-            elif char == ' ':
-                char = '&nbsp;'
-            return f'<span style="color:{color.to_html()}">{char}</span>'
+            prefix = f'<span style="color:#{r:02x}{g:02x}{b:02x}">'
+        else:
+            text_color = "#ffffff" if dark else "#000000"
+            prefix = f'<span style="background:#{r:02x}{g:02x}{b:02x};color:{text_color}">'
+        
+        self._prefix_cache[key] = prefix
+        return prefix
+    
+    def _color_suffix(self) -> str:
+        """Get the closing color markup for the current mode."""
+        if self.mode in (ColorMode.ANSI, ColorMode.ANSI_BG):
+            return self.RESET
+        return '</span>'
+    
+    def _escape(self, char: str) -> str:
+        """Escape a character for the current mode."""
+        table = _ESCAPE_TABLES.get(self.mode)
+        return char.translate(table) if table else char
+    
+    def _escape_array(self, chars: np.ndarray) -> List[List[str]]:
+        """Escape a character matrix, translating each distinct character once."""
+        unique, inverse = np.unique(chars, return_inverse=True)
+        escaped = np.array([self._escape(c) for c in unique.tolist()], dtype=object)
+        return escaped[inverse.reshape(chars.shape)].tolist()
+    
+    def format_array(
+        self,
+        chars: np.ndarray,
+        colors: np.ndarray,
+        is_emoji: bool = False
+    ) -> str:
+        """
+        Format a whole character matrix with its colors.
         
-        elif self.mode == ColorMode.HTML_BG:
-            text_color = "#ffffff" if color.brightness() < 128 else "#000000"
-            if char == ' ':
-                char = '&nbsp;'
-            return f'<span style="background:{color.to_html()};color:{text_color}">{char}</span>'
+        Array equivalent of calling format_character() (or format_emoji())
+        on every pixel, format_line() on every row and joining the rows
+        with newlines, built with a single join and without creating an
+        RGB object per pixel. ANSI output renders the same but only emits
+        an escape sequence when the color changes.
+        
+        Args:
+            chars: 2D array of characters or emojis
+            colors: (H, W, 3) uint8 array of RGB colors
+            is_emoji: Whether chars holds emojis
+            
+        Returns:
+            Formatted text
+        """
+        if self.mode == ColorMode.NONE:
+            return '\n'.join(''.join(row) for row in chars.tolist())
         
-        return char
+        if self.mode in (ColorMode.HTML, ColorMode.HTML_BG):
+            line_start, line_end = '<div class="ascii-line">', '</div>\n'
+        else:
+            line_start, line_end = '', '\n'
+        
+        parts = []
+        if is_emoji:
+            for row in chars.tolist():
+                parts.append(line_start)
+                parts.extend(self.format_emoji(c) for c in row)
+                parts.append(line_end)
+        elif self.mode in (ColorMode.ANSI, ColorMode.ANSI_BG):
+            # Escapes persist until reset, so only emit one when the color
+            # changes and reset once at the end of each line
+            prefix_rows = self._color_prefixes(colors)
+            reset = self.RESET
+            for row, prefix_row in zip(chars.tolist(), prefix_rows):
+                current = None
+                for c, prefix in zip(row, prefix_row):
+                    if prefix != current:
+                        parts.append(prefix)
+                        current = prefix
+                    parts.append(c)
+                parts.append(reset)
+                parts.append(line_end)
+        else:
+            char_rows = self._escape_array(chars) if self.mode in _ESCAPE_TABLES else chars.tolist()
+            prefix_rows = self._color_prefixes(colors)
+            suffix = self._color_suffix()
+            for row, prefix_row in zip(char_rows, prefix_rows):
+                parts.append(line_start)
+                for c, prefix in zip(row, prefix_row):
+                    parts += (prefix, c, suffix)
+                parts.append(line_end)
+        
+        # No newline after the last line
+        if parts:
+            parts[-1] = parts[-1][:-1]
+        return ''.join(parts)
+    
+    def _color_prefixes(self, colors: np.ndarray) -> List[List[str]]:
+        """
+        Build the opening color markup for every pixel of a color array.
+        
+        Each distinct color is formatted once and cached, so large images
+        only pay for their unique colors.
+        """
+        colors = colors.astype(np.int32)
+        packed = (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+        unique, inverse = np.unique(packed, return_inverse=True)
+        
+        table = [self._color_prefix(key) for key in unique.tolist()]
+        return np.array(table, dtype=object)[inverse.reshape(packed.shape)].tolist()
     
     def format_emoji(self, emoji: str, color: Optional[RGB] = None) -> str:
         """
@@ -237,6 +350,23 @@ def quantize_color(color: RGB, levels: int = 8) -> RGB:
     )
 
 
+def quantize_array(colors: np.ndarray, levels: int = 8) -> np.ndarray:
+    """
+    Reduce a whole (H, W, 3) color array to fewer levels.
+    
+    Args:
+        colors: uint8 RGB array
+        levels: Number of levels per channel
+    """
+    step = 256 // levels
+    return (colors // step) * step
+
+
+def brightness_array(colors: np.ndarray) -> np.ndarray:
+    """Calculate perceived brightness (0-255) of a whole (H, W, 3) color array."""
+    return 0.299 * colors[..., 0] + 0.587 * colors[..., 1] + 0.114 * colors[..., 2]
+
+
 def get_dominant_color_name(color: RGB) -> str:
     """Get the name of the dominant color."""
     h, s, l = color.to_hsl()
@@ -267,6 +397,110 @@ def get_dominant_color_name(color: RGB) -> str:
         return "red"
 
 
+# Names returned by get_dominant_color_name, indexed by the codes of
+# get_dominant_color_name_array
+DOMINANT_COLOR_NAMES = (
+    "black", "white", "gray", "red", "orange",
+    "yellow", "green", "cyan", "blue", "purple",
+)
+
+
+def _hue_array(rgb: np.ndarray, maxc: np.ndarray, rangec: np.ndarray) -> np.ndarray:
+    """Hue (0-1) of normalized RGB values, following colorsys."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(
+        r == maxc, bc - gc,
+        np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc)
+    )
+    h = (h / 6.0) % 1.0
+    return np.where(rangec == 0, 0.0, h)
+
+
+def rgb_to_hsl_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert a whole RGB array to HSL.
+    
+    Vectorized equivalent of RGB.to_hsl() for every pixel.
+    
+    Args:
+        rgb: (..., 3) array of RGB values (0-255)
+        
+    Returns:
+        (..., 3) float array of (hue 0-360, saturation 0-100, lightness 0-100)
+    """
+    rgb = rgb.astype(np.float64) / 255
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    s = np.where(rangec == 0, 0.0, s)
+    h = _hue_array(rgb, maxc, rangec)
+    
+    return np.stack([h * 360, s * 100, l * 100], axis=-1)
+
+
+def rgb_to_hsv_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert a whole RGB array to HSV.
+    
+    Vectorized equivalent of RGB.to_hsv() for every pixel.
+    
+    Args:
+        rgb: (..., 3) array of RGB values (0-255)
+        
+    Returns:
+        (..., 3) float array of (hue 0-360, saturation 0-100, value 0-100)
+    """
+    rgb = rgb.astype(np.float64) / 255
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    rangec = maxc - minc
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(rangec == 0, 0.0, rangec / maxc)
+    h = _hue_array(rgb, maxc, rangec)
+    
+    return np.stack([h * 360, s * 100, maxc * 100], axis=-1)
+
+
+def get_dominant_color_name_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Classify every color of an RGB array by dominant color.
+    
+    Vectorized equivalent of get_dominant_color_name() for every pixel.
+    
+    Args:
+        rgb: (..., 3) array of RGB values (0-255)
+        
+    Returns:
+        Integer array of indices into DOMINANT_COLOR_NAMES
+    """
+    hsl = rgb_to_hsl_array(rgb)
+    h, s, l = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+    
+    conditions = [
+        l < 15,
+        l > 85,
+        s < 15,
+        (h < 15) | (h >= 345),
+        h < 45,
+        h < 75,
+        h < 150,
+        h < 210,
+        h < 270,
+        h < 330,
+    ]
+    return np.select(conditions, list(range(10)), default=3).astype(np.int8)
+
+
 # Predefined color palettes
 class ColorPalette:
     """Predefined color palettes for ASCII art."""
@@ -310,3 +544,20 @@ class ColorPalette:
         RGB(186, 225, 255),
         RGB(223, 186, 255),
     ]
+    
+    # Array and string forms, computed once at import
+    GRAYSCALE_RGB = np.array([c.to_tuple() for c in GRAYSCALE], dtype=np.uint8)
+    GRAYSCALE_ANSI = tuple(c.to_ansi_fg() for c in GRAYSCALE)
+    GRAYSCALE_HEX = tuple(c.to_html() for c in GRAYSCALE)
+    
+    RETRO_RGB = np.array([c.to_tuple() for c in RETRO], dtype=np.uint8)
+    RETRO_ANSI = tuple(c.to_ansi_fg() for c in RETRO)
+    RETRO_HEX = tuple(c.to_html() for c in RETRO)
+    
+    NEON_RGB = np.array([c.to_tuple() for c in NEON], dtype=np.uint8)
+    NEON_ANSI = tuple(c.to_ansi_fg() for c in NEON)
+    NEON_HEX = tuple(c.to_html() for c in NEON)
+    
+    PASTEL_RGB = np.array([c.to_tuple() for c in PASTEL], dtype=np.uint8)
+    PASTEL_ANSI = tuple(c.to_ansi_fg() for c in PASTEL)
+    PASTEL_HEX = tuple(c.to_html() for c in PASTEL)
@@ -182,6 +182,75 @@ class ImageProcessor:
         self.processed_image = ImageOps.autocontrast(self.processed_image)
         return self
     
+    def apply_filters_cv2(
+        self,
+        denoise: bool = False,
+        contrast: float = 1.0,
+        brightness: float = 1.0,
+        auto_enhance: bool = False,
+        sharpen: float = 1.0
+    ) -> "ImageProcessor":
+        """
+        Apply the preprocessing filters on a single ndarray with OpenCV.
+        
+        Equivalent to calling denoise(), adjust_contrast(), adjust_brightness(),
+        auto_enhance() and sharpen() in that order, but converts to and from
+        PIL only once. Falls back to those methods without OpenCV.
+        """
+        if not HAS_OPENCV:
+            if denoise:
+                self.denoise()
+            if contrast != 1.0:
+                self.adjust_contrast(contrast)
+            if brightness != 1.0:
+                self.adjust_brightness(brightness)
+            if auto_enhance:
+                self.auto_enhance()
+            if sharpen != 1.0:
+                self.sharpen(sharpen)
+            return self
+        
+        img_array = self.to_ndarray()
+        
+        if denoise:
+            img_array = cv2.bilateralFilter(img_array, 9, 75, 75)
+        
+        # Contrast blends with the mean gray level, brightness with black:
+        # (mean + (x - mean) * contrast) * brightness in one saturating pass
+        if contrast != 1.0 or brightness != 1.0:
+            gray = img_array if img_array.ndim == 2 else cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+            mean = int(gray.mean() + 0.5)
+            img_array = cv2.addWeighted(
+                img_array, contrast * brightness,
+                img_array, 0,
+                mean * (1 - contrast) * brightness
+            )
+        
+        # Stretch each channel to the full 0-255 range
+        if auto_enhance:
+            channels = img_array.reshape(img_array.shape[0], img_array.shape[1], -1)
+            lo = channels.min(axis=(0, 1)).astype(np.float32)
+            hi = channels.max(axis=(0, 1)).astype(np.float32)
+            scale = np.where(hi > lo, 255 / np.maximum(hi - lo, 1), 1)
+            offset = np.where(hi > lo, -lo * scale, 0)
+            stretched = np.clip(channels * scale + offset, 0, 255).astype(np.uint8)
+            img_array = stretched.reshape(img_array.shape)
+        
+        # Sharpness blends with PIL's SMOOTH filter: x * f + smooth * (1 - f)
+        if sharpen != 1.0:
+            smooth = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+            identity = np.zeros((3, 3), dtype=np.float32)
+            identity[1, 1] = 1
+            kernel = identity * sharpen + smooth * (1 - sharpen)
+            sharpened = cv2.filter2D(img_array, -1, kernel)
+            # PIL leaves the one-pixel border unfiltered
+            sharpened[[0, -1]] = img_array[[0, -1]]
+            sharpened[:, [0, -1]] = img_array[:, [0, -1]]
+            img_array = sharpened
+        
+        self.processed_image = Image.fromarray(img_array)
+        return self
+    
     def equalize(self) -> "ImageProcessor":
         """Apply histogram equalization."""
         if self.processed_image.mode == "RGB":
@@ -232,6 +301,10 @@ class ImageProcessor:
         self.processed_image = self.processed_image.crop((left, top, right, bottom))
         return self
     
+    def to_ndarray(self) -> np.ndarray:
+        """Get the processed image as a uint8 array, (H, W) or (H, W, 3)."""
+        return np.array(self.processed_image)
+    
     def get_pixel_matrix(self) -> np.ndarray:
         """Get pixel values as numpy array."""
         if self.processed_image.mode != "L":
@@ -15,6 +15,7 @@ from ascii_converter import (
     ASCIIConverter,
     ConversionSettings,
     convert_image,
+    convert_images,
     convert_to_emoji,
     image_to_ascii,
     image_to_emoji,
@@ -26,7 +27,20 @@ from character_sets import (
     get_charset_by_name,
     get_emoji_set_by_name,
 )
-from color_handler import ColorMode, RGB
+from color_handler import (
+    ColorMode,
+    ColorHandler,
+    RGB,
+    quantize_color,
+    quantize_array,
+    brightness_array,
+    rgb_to_hsl_array,
+    rgb_to_hsv_array,
+    get_dominant_color_name,
+    get_dominant_color_name_array,
+    DOMINANT_COLOR_NAMES,
+    ColorPalette,
+)
 
 
 @pytest.fixture
@@ -94,6 +108,27 @@ class TestCharacterMapper:
         assert mapper.is_emoji
         char = mapper.get_character(128)
         assert char in EmojiSet.BRIGHTNESS.value
+    
+    def test_map_array_matches_get_character(self):
+        mapper = CharacterMapper(charset=CharacterSet.DETAILED)
+        gray = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        chars = mapper.map_array(gray)
+        assert chars.shape == gray.shape
+        for value, char in zip(gray.ravel(), chars.ravel()):
+            assert char == mapper.get_character(int(value))
+    
+    def test_get_character_u8_matches_get_character(self):
+        mapper = CharacterMapper(charset=CharacterSet.STANDARD)
+        for value in range(256):
+            assert mapper.get_character_u8(value) == mapper.get_character(value)
+    
+    def test_map_colored_emoji_array_matches_scalar(self):
+        mapper = CharacterMapper(emoji_set=EmojiSet.BRIGHTNESS, use_emoji=True)
+        rgb = np.random.default_rng(0).integers(0, 256, (20, 20, 3), dtype=np.uint8)
+        emojis = mapper.map_colored_emoji_array(rgb)
+        assert emojis.shape == (20, 20)
+        for (r, g, b), emoji in zip(rgb.reshape(-1, 3), emojis.ravel()):
+            assert emoji == mapper.get_colored_emoji(int(r), int(g), int(b))
 
 
 class TestCharsetHelpers:
@@ -108,6 +143,11 @@ class TestCharsetHelpers:
         assert get_emoji_set_by_name("hearts") == EmojiSet.HEARTS
         assert get_emoji_set_by_name("space") == EmojiSet.SPACE
         assert get_emoji_set_by_name("invalid") == EmojiSet.BRIGHTNESS
+    
+    def test_emoji_set_values_are_tuples(self):
+        for emoji_set in EmojiSet:
+            assert isinstance(emoji_set.value, tuple)
+            hash(emoji_set.value)
 
 
 class TestRGB:
@@ -133,6 +173,13 @@ class TestRGB:
         ansi = color.to_ansi_fg()
         assert "38;2;255;128;64" in ansi
     
+    def test_rgb_is_hashable_and_immutable(self):
+        color = RGB(1, 2, 3)
+        assert {color: "x"}[RGB(1, 2, 3)] == "x"
+        assert not hasattr(color, "__dict__")
+        with pytest.raises(AttributeError):
+            color.r = 5
+    
     def test_from_hex(self):
         color = RGB.from_hex("#ff8040")
         assert color.r == 255
@@ -140,6 +187,72 @@ class TestRGB:
         assert color.b == 64
 
 
+class TestColorArrays:
+    """Tests for array-level color helpers."""
+    
+    def test_brightness_array(self):
+        colors = np.array([[[255, 128, 64], [0, 0, 0]]], dtype=np.uint8)
+        result = brightness_array(colors)
+        assert result.shape == (1, 2)
+        assert result[0, 0] == RGB(255, 128, 64).brightness()
+        assert result[0, 1] == 0
+    
+    def test_quantize_array(self):
+        colors = np.array([[[255, 128, 63]]], dtype=np.uint8)
+        expected = quantize_color(RGB(255, 128, 63)).to_tuple()
+        assert tuple(quantize_array(colors)[0, 0]) == expected
+    
+    def test_palette_tables(self):
+        assert ColorPalette.RETRO_RGB.shape == (len(ColorPalette.RETRO), 3)
+        assert ColorPalette.NEON_HEX[0] == ColorPalette.NEON[0].to_html()
+        assert ColorPalette.GRAYSCALE_ANSI[-1] == ColorPalette.GRAYSCALE[-1].to_ansi_fg()
+    
+    def test_hsl_hsv_arrays_match_scalar(self):
+        colors = np.random.default_rng(0).integers(0, 256, (50, 3), dtype=np.uint8)
+        colors[0] = (128, 128, 128)
+        hsl = rgb_to_hsl_array(colors)
+        hsv = rgb_to_hsv_array(colors)
+        for rgb, hsl_row, hsv_row in zip(colors, hsl, hsv):
+            color = RGB(*map(int, rgb))
+            assert np.allclose(hsl_row, color.to_hsl())
+            assert np.allclose(hsv_row, color.to_hsv())
+    
+    def test_dominant_color_name_array(self):
+        colors = np.random.default_rng(1).integers(0, 256, (100, 3), dtype=np.uint8)
+        codes = get_dominant_color_name_array(colors)
+        for rgb, code in zip(colors, codes):
+            assert DOMINANT_COLOR_NAMES[code] == get_dominant_color_name(RGB(*map(int, rgb)))
+    
+    @pytest.mark.parametrize("mode", [ColorMode.NONE, ColorMode.HTML, ColorMode.HTML_BG])
+    def test_format_array_matches_format_character(self, mode):
+        handler = ColorHandler(mode)
+        chars = np.array([['<', ' ', '@'], ['&', '"', '.']])
+        colors = np.random.default_rng(0).integers(0, 256, (2, 3, 3), dtype=np.uint8)
+        text = handler.format_array(chars, colors)
+        
+        expected = '\n'.join(
+            handler.format_line(''.join(
+                handler.format_character(str(c), RGB(*map(int, rgb)))
+                for c, rgb in zip(row, color_row)
+            ))
+            for row, color_row in zip(chars, colors)
+        )
+        assert text == expected
+    
+    @pytest.mark.parametrize("mode", [ColorMode.ANSI, ColorMode.ANSI_BG])
+    def test_format_array_ansi_emits_escape_per_color_run(self, mode):
+        handler = ColorHandler(mode)
+        chars = np.array([['a', 'b', 'c'], ['d', 'e', 'f']])
+        colors = np.zeros((2, 3, 3), dtype=np.uint8)
+        colors[:, 2] = (255, 0, 0)
+        text = handler.format_array(chars, colors)
+        
+        black = handler.format_character('x', RGB(0, 0, 0))[:-len('x' + ColorHandler.RESET)]
+        red = handler.format_character('x', RGB(255, 0, 0))[:-len('x' + ColorHandler.RESET)]
+        reset = ColorHandler.RESET
+        assert text == f"{black}ab{red}c{reset}\n{black}de{red}f{reset}"
+
+
 class TestConversionSettings:
     """Tests for ConversionSettings dataclass."""
     
@@ -187,6 +300,13 @@ class TestASCIIConverter:
         assert art.width == 30
         assert art.settings.contrast == 1.5
     
+    def test_cv2_fastpath_conversion(self, sample_image):
+        converter = ASCIIConverter(sample_image)
+        art = converter.convert(width=20, use_cv2_fastpath=True, sharpen=1.5)
+        
+        assert art.width == 20
+        assert len(str(art)) > 0
+    
     def test_emoji_conversion(self, sample_image):
         converter = ASCIIConverter(sample_image)
         art = converter.convert(
@@ -227,6 +347,17 @@ class TestConvenienceFunctions:
         assert art.is_emoji
         assert art.width == 15
     
+    def test_convert_images(self, sample_image, color_image, tmp_path):
+        arts = convert_images([sample_image, color_image], output_dir=tmp_path, width=20)
+        assert [art.width for art in arts] == [20, 20]
+        assert arts[0].art == convert_image(sample_image, width=20).art
+        assert len(list(tmp_path.glob("*.txt"))) == 2
+    
+    def test_convert_images_process_pool(self, sample_image, color_image, monkeypatch):
+        monkeypatch.setattr(f"{convert_images.__module__}.PARALLEL_MIN_PIXELS", 0)
+        arts = convert_images([sample_image, color_image], workers=2, width=20)
+        assert arts[1].art == convert_image(color_image, width=20).art
+    
     def test_image_to_ascii(self, sample_image):
         result = image_to_ascii(sample_image, width=20)
         assert isinstance(result, str)
@@ -295,6 +426,13 @@ class TestColorModes:
         art_str = str(art)
         assert "<html" in art_str.lower()
         assert "color:" in art_str
+    
+    def test_color_levels_quantize_output(self, color_image):
+        import re
+        art = convert_image(color_image, width=20, color_mode=ColorMode.ANSI, color_levels=8)
+        components = re.findall(r"38;2;(\d+);(\d+);(\d+)m", str(art))
+        assert components
+        assert all(int(v) % 32 == 0 for rgb in components for v in rgb)
 
 
 class TestEdgeCases:
@@ -243,6 +243,32 @@ class TestPixelData:
         assert isinstance(matrix, np.ndarray)
         assert len(matrix.shape) == 3  # Should be 3D for RGB
         assert matrix.shape[2] == 3  # RGB channels
+    
+    def test_to_ndarray(self, sample_image_path):
+        processor = ImageProcessor(sample_image_path)
+        array = processor.to_ndarray()
+        
+        assert array.dtype == np.uint8
+        assert array.shape == (150, 200, 3)
+
+
+class TestCv2Filters:
+    """Tests for the single-pass OpenCV filter path."""
+    
+    def test_matches_pil_filters(self, gradient_image_path):
+        pytest.importorskip("cv2")
+        fast = ImageProcessor(gradient_image_path)
+        fast.apply_filters_cv2(contrast=1.5, brightness=1.2, sharpen=2.0)
+        
+        slow = ImageProcessor(gradient_image_path)
+        slow.adjust_contrast(1.5).adjust_brightness(1.2).sharpen(2.0)
+        
+        diff = np.abs(fast.to_ndarray().astype(int) - slow.to_ndarray().astype(int))
+        assert diff.max() <= 2
+    
+    def test_returns_self(self, sample_image_path):
+        processor = ImageProcessor(sample_image_path)
+        assert processor.apply_filters_cv2(denoise=True, auto_enhance=True) is processor
 
 
 class TestChaining: